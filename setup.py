@@ -4,7 +4,7 @@ setup(
     name="bmstu-labs-utility",
     version="0.1.0",
     packages=find_packages(),
-    install_requires=[
-        "tabulate",
-    ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
 )
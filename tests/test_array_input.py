@@ -0,0 +1,100 @@
+from utility._term import KEY_ESC, KEY_LEFT, KEY_RIGHT
+from utility.array_input import _array_state, _array_step, format_number
+
+
+def feed(state: dict, keys) -> list:
+    return [_array_step(state, key) for key in keys]
+
+
+def test_enter_stores_formatted_value_and_moves_on():
+    state = _array_state(3)
+    assert feed(state, '1.50\r') == [True] * 5
+    assert state['array'] == ['1.5', '', '']
+    assert state['pos'] == 1
+    assert state['value'] == []
+    assert state['result'] is None
+
+
+def test_int_values_are_truncated():
+    state = _array_state(2, as_int=True)
+    feed(state, '2.7\r')
+    assert state['array'] == ['2', '']
+
+
+def test_invalid_value_shows_error_and_stays():
+    state = _array_state(2)
+    assert feed(state, '1e\r') == [True, True, True]
+    assert state['error'] == "Введите корректное число"
+    assert state['pos'] == 0
+    assert state['array'] == ['', '']
+    # Typing again clears the error
+    feed(state, '5')
+    assert state['error'] == ''
+    assert ''.join(state['value']) == '1e5'
+
+
+def test_validator_runs_on_numbers_only():
+    seen = []
+
+    def validator(value):
+        seen.append(value)
+        return float(value) > 0, "Нужно положительное"
+
+    state = _array_state(1, validator=validator)
+    feed(state, '-\r')
+    assert seen == []
+    feed(state, '\x7f-1\r')
+    assert seen == ['-1']
+    assert state['error'] == "Нужно положительное"
+
+
+def test_backspace():
+    state = _array_state(2)
+    assert _array_step(state, '\x7f') is False
+    feed(state, '12\x7f')
+    assert state['value'] == ['1']
+
+
+def test_arrows_clear_value_and_stop_at_the_edges():
+    state = _array_state(2)
+    assert _array_step(state, KEY_LEFT) is False
+    feed(state, '7')
+    assert _array_step(state, KEY_RIGHT) is True
+    assert state['pos'] == 1
+    assert state['value'] == []
+    assert _array_step(state, KEY_RIGHT) is False
+
+
+def test_empty_enter_moves_right_except_on_the_last_element():
+    state = _array_state(2)
+    assert _array_step(state, '\r') is True
+    assert state['pos'] == 1
+    assert _array_step(state, '\r') is False
+
+
+def test_ignores_other_characters():
+    state = _array_state(2)
+    assert _array_step(state, 'x') is False
+    assert state['value'] == []
+
+
+def test_completes_once_every_element_is_filled():
+    state = _array_state(3)
+    feed(state, ['\r', '2', '\r', '3', '\r', KEY_LEFT, KEY_LEFT])
+    assert state['array'] == ['', '2', '3']
+    assert state['result'] is None
+    feed(state, '1\r')
+    assert state['array'] == ['1', '2', '3']
+    assert state['result'] == 'complete'
+
+
+def test_escape_cancels():
+    state = _array_state(2)
+    assert _array_step(state, KEY_ESC) is False
+    assert state['result'] == 'cancel'
+
+
+def test_format_number():
+    assert format_number('1.500') == '1.5'
+    assert format_number('2.7', as_int=True) == '2'
+    assert format_number('abc') == 'abc'
@@ -0,0 +1,127 @@
+from utility._term import KEY_DOWN, KEY_ESC, KEY_LEFT, KEY_RIGHT, KEY_UP
+from utility.matrix_input import _matrix_state, _matrix_step, _render_box, format_number
+
+
+def feed(state: dict, keys) -> list:
+    return [_matrix_step(state, key) for key in keys]
+
+
+def test_enter_fills_cell_and_moves_to_next_empty():
+    state = _matrix_state(2, 2)
+    feed(state, '1.0\r')
+    assert state['matrix'] == [['1', ''], ['', '']]
+    assert (state['row'], state['col']) == (0, 1)
+    assert state['empty'] == [1, 2, 3]
+    assert state['value'] == []
+
+
+def test_next_empty_skips_filled_cells():
+    state = _matrix_state(2, 2)
+    feed(state, [KEY_DOWN, '3', '\r'])
+    # Next empty after (1, 0) is (1, 1)
+    assert (state['row'], state['col']) == (1, 1)
+    feed(state, [KEY_UP, KEY_LEFT, '1', '\r'])
+    # (0, 1) is the next empty cell after (0, 0), (1, 0) is already filled
+    assert (state['row'], state['col']) == (0, 1)
+    assert state['empty'] == [1, 3]
+
+
+def test_previous_empty_when_none_follows():
+    state = _matrix_state(2, 2)
+    feed(state, [KEY_DOWN, KEY_RIGHT, '4', '\r'])
+    assert (state['row'], state['col']) == (0, 0)
+    feed(state, [KEY_DOWN, '3', '\r'])
+    assert (state['row'], state['col']) == (0, 0)
+    assert state['empty'] == [0, 1]
+
+
+def test_completes_once_every_cell_is_filled():
+    state = _matrix_state(2, 2, as_int=True)
+    feed(state, [KEY_RIGHT, '2', '\r', '3', '\r', '4', '\r'])
+    assert state['result'] is None
+    assert (state['row'], state['col']) == (0, 0)
+    feed(state, '1.9\r')
+    assert state['matrix'] == [['1', '2'], ['3', '4']]
+    assert state['result'] == 'complete'
+
+
+def test_invalid_value_shows_error_and_keeps_it():
+    state = _matrix_state(1, 2)
+    assert feed(state, '-\r') == [True, True]
+    assert state['error'] == "Введите корректное число"
+    assert state['value'] == ['-']
+    assert state['empty'] == [0, 1]
+
+
+def test_empty_enter_does_nothing():
+    state = _matrix_state(1, 2)
+    assert _matrix_step(state, '\r') is False
+    assert (state['row'], state['col']) == (0, 0)
+
+
+def test_backspace():
+    state = _matrix_state(1, 1)
+    assert _matrix_step(state, '\x7f') is False
+    feed(state, '12\x7f')
+    assert state['value'] == ['1']
+
+
+def test_arrows_clear_value_and_stop_at_the_edges():
+    state = _matrix_state(2, 2)
+    assert _matrix_step(state, KEY_UP) is False
+    assert _matrix_step(state, KEY_LEFT) is False
+    feed(state, '5')
+    assert _matrix_step(state, KEY_DOWN) is True
+    assert state['value'] == []
+    assert _matrix_step(state, KEY_DOWN) is False
+    assert _matrix_step(state, KEY_RIGHT) is True
+    assert (state['row'], state['col']) == (1, 1)
+
+
+def test_numbers_ignore_other_characters():
+    state = _matrix_state(1, 1)
+    assert _matrix_step(state, 'x') is False
+    assert state['value'] == []
+
+
+def test_symbols_are_one_character():
+    state = _matrix_state(1, 2, as_symbol=True)
+    feed(state, 'ab\r')
+    assert state['error'] == "Введите один символ"
+    feed(state, '\x7f\rж\r')
+    assert state['matrix'] == [['a', 'ж']]
+    assert state['result'] == 'complete'
+
+
+def test_escape_cancels():
+    state = _matrix_state(1, 1)
+    assert _matrix_step(state, KEY_ESC) is False
+    assert state['result'] == 'cancel'
+
+
+def test_format_number():
+    assert format_number('1.500') == '1.5'
+    assert format_number('2.7', as_int=True) == '2'
+    assert format_number('1.500', as_symbol=True) == '1.500'
+
+
+def test_render_box_sizes_columns_to_content():
+    assert _render_box(['', 'A'], [['x', '1'], ['y', '1234']]) == [
+        '╭────┬──────╮',
+        '│    │    A │',
+        '├────┼──────┤',
+        '│  x │    1 │',
+        '├────┼──────┤',
+        '│  y │ 1234 │',
+        '╰────┴──────╯',
+    ]
+
+
+def test_render_box_with_given_widths():
+    assert _render_box(['', 'A'], [['x', '1']], [1, 2]) == [
+        '╭───┬────╮',
+        '│   │  A │',
+        '├───┼────┤',
+        '│ x │  1 │',
+        '╰───┴────╯',
+    ]
@@ -0,0 +1,63 @@
+from itertools import product
+
+from utility._term import NUMBER_RE, NUMERIC_CHARS, fmt_float, fmt_int, fmt_symbol, number_to_str
+
+
+def float_accepts(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def test_number_re_matches_float():
+    # Every value up to 4 characters that can be typed into a numeric cell
+    for length in range(1, 5):
+        for chars in product(sorted(NUMERIC_CHARS), repeat=length):
+            value = ''.join(chars)
+            assert bool(NUMBER_RE.fullmatch(value)) == float_accepts(value), value
+
+
+def test_number_to_str_drops_trailing_zeros():
+    assert number_to_str(1.5) == '1.5'
+    assert number_to_str(12.0) == '12'
+    assert number_to_str(100) == '100'
+
+
+def test_number_to_str_keeps_exponent():
+    assert number_to_str(1.5e-10) == '1.5e-10'
+    assert number_to_str(1.1e20) == '1.1e+20'
+    assert number_to_str(1e-5) == '1e-05'
+
+
+def test_fmt_float():
+    assert fmt_float('007') == '7'
+    assert fmt_float('1.500') == '1.5'
+    assert fmt_float(' -3.0 ') == '-3'
+    assert fmt_float('.5') == '0.5'
+    assert fmt_float('1e3') == '1000'
+    assert fmt_float('1.5e-10') == '1.5e-10'
+    assert fmt_float('1e400') == 'inf'
+
+
+def test_fmt_float_rejects_non_numbers():
+    for value in ['', '-', '1e', '1.2.3', '--1', 'abc']:
+        assert fmt_float(value) is None, value
+
+
+def test_fmt_int():
+    assert fmt_int('007') == '7'
+    assert fmt_int('1.9') == '1'
+    assert fmt_int('-2.5') == '-2'
+    assert fmt_int('1e3') == '1000'
+    assert fmt_int('1.1e20') == '110000000000000000000'
+
+
+def test_fmt_int_rejects_non_numbers_and_infinity():
+    for value in ['', '-', '1e', 'abc', '1e400', '-1e400']:
+        assert fmt_int(value) is None, value
+
+
+def test_fmt_symbol():
+    assert fmt_symbol('ж') == 'ж'
@@ -0,0 +1,263 @@
+"""Terminal input and output shared by the array and matrix input."""
+import math
+import os
+import re
+import select
+import sys
+import tty
+import termios
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Union, Callable, Optional, Tuple, List, Iterator
+
+KEY_ESC = '\x1b'
+KEY_RIGHT = '\x1b[C'
+KEY_LEFT = '\x1b[D'
+KEY_UP = '\x1b[A'
+KEY_DOWN = '\x1b[B'
+
+# Seconds to wait for the rest of an escape sequence once ESC has been read
+ESC_TIMEOUT = 0.05
+
+# Bounds in microseconds of the wait for input between two passes of the input loop,
+# the wait doubles while nothing is typed and drops back on the next key
+IDLE_MIN_US = 200
+IDLE_MAX_US = 50_000
+
+# Characters that can appear in a number, anything else is ignored when typing numbers
+NUMERIC_CHARS = frozenset("0123456789.-+eE ")
+
+# Shape of a number that float() accepts, for values made up of NUMERIC_CHARS only
+NUMBER_RE = re.compile(r' *[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)? *')
+
+@contextmanager
+def raw_mode(fd: int):
+    """Keep the terminal in raw mode for the duration of the block."""
+    old_settings = termios.tcgetattr(fd)
+    try:
+        # TCSANOW: the default TCSAFLUSH would discard input typed ahead of the session
+        tty.setraw(fd, termios.TCSANOW)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+def _read(fd: int, n: int) -> bytes:
+    """Read up to n bytes, EOFError once the input is closed."""
+    data = os.read(fd, n)
+    if not data:
+        raise EOFError
+    return data
+
+def _read1(fd: int) -> str:
+    """Read a single character from a terminal that is already in raw mode."""
+    data = _read(fd, 1)
+    # Pull in the continuation bytes of a multi-byte UTF-8 character
+    if data[0] >= 0xC0:
+        length = 2 if data[0] < 0xE0 else 3 if data[0] < 0xF0 else 4
+        while len(data) < length:
+            data += _read(fd, length - len(data))
+    return data.decode(errors='replace')
+
+def _read_key(fd: int) -> str:
+    """Read a key, returning an escape sequence such as an arrow key as one string."""
+    char = _read1(fd)
+    if char != KEY_ESC:
+        return char
+    # A lone ESC is the Escape key, a sequence arrives together with it
+    if not select.select([fd], [], [], ESC_TIMEOUT)[0]:
+        return char
+    # Any other byte right after ESC is an Alt+key combination, which is
+    # taken as Escape as a whole so that it does not leak into the input
+    if _read(fd, 1) not in (b'[', b'O'):
+        return char
+    # CSI and SS3 sequences end with a byte in the 0x40-0x7E range, the sequence is
+    # read byte by byte so that nothing typed after it is taken from the terminal
+    seq = bytearray()
+    while not seq or not 0x40 <= seq[-1] <= 0x7E:
+        if not select.select([fd], [], [], ESC_TIMEOUT)[0]:
+            break
+        seq += _read(fd, 1)
+    return '\x1b[' + seq.decode(errors='replace')
+
+def read_keys(fd: int, timeout: Optional[float] = None) -> Iterator[str]:
+    """
+    Wait for a key, then also yield every key that is already waiting, e.g. a paste.
+    
+    Yields nothing if no key arrives within timeout seconds. Keys are only read
+    from the terminal as they are consumed, so whatever the caller leaves is
+    still there for the next reader of stdin.
+    """
+    if not select.select([fd], [], [], timeout)[0]:
+        return
+    yield _read_key(fd)
+    while select.select([fd], [], [], 0)[0]:
+        yield _read_key(fd)
+
+def number_to_str(num: Union[int, float]) -> str:
+    """Format an already parsed number, dropping trailing zeros after the decimal point."""
+    # Only the mantissa has zeros to drop, the exponent is kept as it is
+    mantissa, e, exponent = f"{num}".partition('e')
+    if '.' in mantissa:
+        mantissa = mantissa.rstrip('0').rstrip('.')
+    return mantissa + e + exponent
+
+def parse_float(value: str) -> Optional[float]:
+    """
+    Parse an entered value as a float, None if it is not a number.
+    
+    Typed values are checked against NUMBER_RE first, so an invalid one is
+    rejected without float() raising an exception.
+    """
+    if NUMERIC_CHARS.issuperset(value):
+        return float(value) if NUMBER_RE.fullmatch(value) else None
+    # Values that could not have been typed in, e.g. passed to format_number
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=256)
+def fmt_float(value: str) -> Optional[str]:
+    """Format an entered float, None if it is not a number."""
+    num = parse_float(value)
+    return None if num is None else number_to_str(num)
+
+@lru_cache(maxsize=256)
+def fmt_int(value: str) -> Optional[str]:
+    """Format an entered integer, None if it is not a number."""
+    num = parse_float(value)
+    # Huge exponents parse as infinity, which has no integer value
+    if num is None or not math.isfinite(num):
+        return None
+    return str(int(num))
+
+def fmt_symbol(value: str) -> Optional[str]:
+    """Symbols are kept as entered."""
+    return value
+
+# Range of the integers that fit in a numpy int64 array
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+def int64_validator(validator: Optional[Callable[[str], Tuple[bool, str]]] = None
+                    ) -> Callable[[str], Tuple[bool, str]]:
+    """
+    Wrap a validator to also reject integers that do not fit in int64.
+    
+    Validators only get values that are numbers, so the value always parses here.
+    """
+    def check(value: str) -> Tuple[bool, str]:
+        if not INT64_MIN <= int(parse_float(value)) <= INT64_MAX:
+            return False, "Число не помещается в int64"
+        return validator(value) if validator is not None else (True, "")
+    return check
+
+CUU_FMT = b"\033[%dA"
+CUD_FMT = b"\033[%dB"
+CHA_FMT = b"\033[%dG"
+
+# Cursor up/down by n lines as CUU[n]/CUD[n], longer moves are formatted when needed
+CUU = [b""] + [CUU_FMT % n for n in range(1, 256)]
+CUD = [b""] + [CUD_FMT % n for n in range(1, 256)]
+CLR_LINE = b"\033[2K"
+CLR_EOL = b"\033[K"
+
+# Output of the current refresh, written to the terminal in one go
+_frame = bytearray()
+
+def _emit(seq: bytes) -> None:
+    """Append raw bytes to the current frame."""
+    _frame.extend(seq)
+
+def _flush_frame() -> None:
+    """Write the current frame to stdout with a single call and reset it."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(_frame)
+    sys.stdout.flush()
+    _frame.clear()
+
+@lru_cache(maxsize=None)
+def _cha(col: int) -> bytes:
+    """Sequence moving the cursor to a 1-based column of the current line."""
+    return CHA_FMT % col
+
+def _move(line: int, col: int, to_line: int, to_col: int) -> None:
+    """Emit the escape sequence moving the cursor between two display positions."""
+    if to_line < line:
+        n = line - to_line
+        _emit(CUU[n] if n < len(CUU) else CUU_FMT % n)
+    elif to_line > line:
+        n = to_line - line
+        _emit(CUD[n] if n < len(CUD) else CUD_FMT % n)
+    if to_col != col:
+        _emit(_cha(to_col + 1) if to_col else b'\r')
+
+def redraw(prev_lines: List[str], new_lines: List[str]) -> None:
+    """
+    Redraw a display printed right above the cursor, writing only what changed.
+
+    The cursor is expected at the start of the line below ``prev_lines`` and is
+    left at the start of the line below ``new_lines``. Every character is
+    assumed to occupy a single terminal column.
+    """
+    line, col = len(prev_lines), 0
+    for i, new in enumerate(new_lines):
+        if i >= len(prev_lines):
+            # Lines past the previous display do not exist yet, append them
+            _move(line, col, i, 0)
+            _emit(new.encode())
+            _emit(b'\r\n')
+            line, col = i + 1, 0
+            continue
+        old = prev_lines[i]
+        if new == old:
+            continue
+        start = 0
+        while start < len(new) and start < len(old) and new[start] == old[start]:
+            start += 1
+        _move(line, col, i, start)
+        _emit(new[start:].encode())
+        if len(old) > len(new):
+            _emit(CLR_EOL)
+        line, col = i, len(new)
+    for i in range(len(new_lines), len(prev_lines)):
+        _move(line, col, i, 0)
+        _emit(CLR_LINE)
+        line, col = i, 0
+    _move(line, col, len(new_lines), 0)
+    _flush_frame()
+
+def run_session(step: Callable[[dict, str], bool], state: dict,
+                display: Callable[..., None], cursor: Callable[[dict], Any]) -> None:
+    """
+    Run an input session on stdin until state['result'] is set.
+    
+    step applies a key to the state and tells whether the display changed,
+    display(touched) refreshes it given the cursor positions the keys were
+    applied at, cursor(state) returns the current one.
+    """
+    fd = sys.stdin.fileno()
+    with raw_mode(fd):
+        display()
+        idle_us = IDLE_MIN_US
+        while state['result'] is None:
+            # Apply everything typed or pasted so far, then refresh once
+            # and only if the keys changed something, the last refresh shows
+            # the finished input without the cursor. Keys after the one that
+            # finishes the input are left unread
+            touched = set()
+            changed = False
+            idle = True
+            for char in read_keys(fd, idle_us / 1e6):
+                idle = False
+                touched.add(cursor(state))
+                changed = step(state, char) or changed
+                if state['result'] is not None:
+                    break
+            if idle:
+                # Nothing typed, so nothing to redraw either, wait longer next time
+                idle_us = min(idle_us * 2, IDLE_MAX_US)
+                continue
+            idle_us = IDLE_MIN_US
+            if changed:
+                display(touched)
@@ -1,34 +1,95 @@
-from tabulate import tabulate
-import os
-import sys
-import tty
-import termios
-from typing import Union, Callable, Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List
 
-def getch():
-    """Get a single character from stdin."""
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+from ._term import (
+    KEY_ESC, KEY_LEFT, KEY_RIGHT, NUMERIC_CHARS,
+    redraw, run_session, fmt_float, fmt_int, int64_validator,
+)
+
+# Formatter for the as_int flag of an input session, picked once
+# instead of checking the flag on every value
+_FORMATTERS = {False: fmt_float, True: fmt_int}
 
 def format_number(value: str, as_int: bool = False) -> str:
     """Format number string by removing leading zeros and proper decimal handling."""
-    try:
-        if as_int:
-            return str(int(float(value)))
-        else:
-            num = float(value)
-            s = f"{num}"
-            if '.' in s:
-                s = s.rstrip('0').rstrip('.')
-            return s
-    except ValueError:
-        return value
+    formatted = _FORMATTERS[bool(as_int)](value)
+    return value if formatted is None else formatted
+
+def _array_state(size: int, as_int: bool = False,
+                 validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> dict:
+    """
+    Everything the key handling works with, see _array_step.
+    
+    Without a validator any value the formatter accepts is valid.
+    """
+    return {
+        'size': size,
+        'format': _FORMATTERS[bool(as_int)],
+        'validator': validator,
+        'array': [''] * size,
+        'filled': 0,
+        'pos': 0,
+        # Characters typed into the current element, kept as a list so typing and Backspace edit it in place
+        'value': [],
+        'error': '',
+        'result': None,
+    }
+
+def _array_step(state: dict, char: str) -> bool:
+    """
+    Apply one key to the array input state.
+    
+    Does no I/O: returns True if the key changed what should be displayed and sets
+    state['result'] to 'cancel' or 'complete' once the input is over.
+    """
+    array, size, pos = state['array'], state['size'], state['pos']
+    
+    if char == '\r' or char == '\n':  # Enter
+        value = ''.join(state['value'])
+        if value:
+            # The value is parsed once, both to check it and to format it,
+            # a number needs no further check unless there is a validator
+            formatted_value = state['format'](value)
+            validator = state['validator']
+            if formatted_value is None:
+                is_valid, error = False, "Введите корректное число"
+            else:
+                is_valid, error = validator(value) if validator is not None else (True, "")
+            if not is_valid:
+                state['error'] = error
+                return True
+            if array[pos] == '':
+                state['filled'] += 1
+            array[pos] = formatted_value
+            state['value'].clear()
+            state['error'] = ''
+            if state['filled'] == size:
+                state['result'] = 'complete'
+        elif pos == size - 1:
+            return False
+        if pos < size - 1:
+            state['pos'] = pos + 1
+        return True
+    elif char == '\x7f':  # Backspace
+        if not state['value']:
+            return False
+        del state['value'][-1:]
+        state['error'] = ''
+        return True
+    elif char == KEY_LEFT or char == KEY_RIGHT:
+        pos += -1 if char == KEY_LEFT else 1
+        if not 0 <= pos < size:
+            return False
+        state['value'].clear()
+        state.update(pos=pos, error='')
+        return True
+    elif char == KEY_ESC:  # Just Escape - cancel input
+        state['result'] = 'cancel'
+        return False
+    elif char in NUMERIC_CHARS:
+        state['value'].append(char)
+        state['error'] = ''
+        return True
+    return False
 
 def input_array(size: int, as_int: bool = False,
                validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> Optional[list]:
@@ -45,112 +106,45 @@ def input_array(size: int, as_int: bool = False,
     Returns:
         Optional[list]: Введенный массив или None если ввод был отменен
     """
-    def default_validator(value: str) -> Tuple[bool, str]:
-        try:
-            if as_int:
-                int(float(value))
-            else:
-                float(value)
-            return True, ""
-        except ValueError:
-            return False, "Введите корректное число"
-    
-    if validator is None:
-        validator = default_validator
+    state = _array_state(size, as_int, validator)
+    array = state['array']
+    last_display = []
     
-    array = [''] * size
-    current_pos = 0
-    current_value = ''
-    error_message = ''
-    last_display_lines = 0
-    first_display = True
+    def cell_text(i: int) -> str:
+        """Text shown for an array element, including the input cursor while input goes on."""
+        if i == state['pos'] and state['result'] is None:
+            return ''.join(state['value']) + '█'
+        return array[i] if array[i] != '' else '_'
     
-    def move_cursor_up(n):
-        if n > 0:
-            print(f"\033[{n}A", end='')
+    # The array line as '[', cell, ', ', cell, ..., ']' with element i at index 2 * i + 1,
+    # only the elements that change are replaced between refreshes
+    display = ['['] + [', '] * (2 * size - 1) + [']']
+    for i in range(size):
+        display[2 * i + 1] = cell_text(i)
     
-    def clear_line():
-        print("\033[2K", end='')
-    
-    def display_array():
-        nonlocal last_display_lines, first_display
+    def display_array(touched=()):
+        nonlocal last_display
         
-        # Generate array display
-        display = ['[']
-        for i in range(size):
-            if i == current_pos:
-                value = current_value + '█' if current_value else '█'
-            else:
-                value = array[i] if array[i] != '' else '_'
-            display.append(value)
-            if i < size - 1:
-                display.append(', ')
-        display.append(']')
+        # Values only change under the cursor, so only the current element and
+        # those the cursor has been on since the last refresh are updated
+        for i in touched:
+            display[2 * i + 1] = cell_text(i)
+        display[2 * state['pos'] + 1] = cell_text(state['pos'])
         
-        # Convert to string
-        display_str = ''.join(display)
-        display_lines = [display_str]
+        display_lines = [''.join(display)]
         display_lines.append("ESC - отмена, Enter - ввод, ← → - перемещение")
         
-        if error_message:
-            display_lines.append(f"Ошибка: {error_message}")
-        
-        if not first_display:
-            move_cursor_up(last_display_lines)
-            for _ in range(last_display_lines):
-                clear_line()
-                print()
-            move_cursor_up(last_display_lines)
+        if state['error']:
+            display_lines.append(f"Ошибка: {state['error']}")
         
-        print('\n'.join(display_lines))
-        last_display_lines = len(display_lines)
-        first_display = False
+        redraw(last_display, display_lines)
+        last_display = display_lines
     
-    while True:
-        display_array()
-        
-        char = getch()
-        
-        if char == '\r' or char == '\n':  # Enter
-            if current_value:
-                is_valid, error = validator(current_value)
-                if is_valid:
-                    array[current_pos] = format_number(current_value, as_int)
-                    current_value = ''
-                    if current_pos < size - 1:
-                        current_pos += 1
-                    error_message = ''
-                else:
-                    error_message = error
-            elif current_pos < size - 1:
-                current_pos += 1
-        elif char == '\x7f':  # Backspace
-            if current_value:
-                current_value = current_value[:-1]
-                error_message = ''
-        elif char == '\x1b':  # Escape sequence
-            next_char = getch()
-            if next_char == '[':  # Arrow keys
-                direction = getch()
-                if direction == 'D' and current_pos > 0:  # Left
-                    current_pos -= 1
-                    current_value = ''
-                    error_message = ''
-                elif direction == 'C' and current_pos < size - 1:  # Right
-                    current_pos += 1
-                    current_value = ''
-                    error_message = ''
-            else:  # Just Escape - cancel input
-                print()  # Move to next line before returning
-                return None
-        elif char.isprintable():
-            current_value += char
-            error_message = ''
-        
-        # Check if array is complete
-        if all(cell != '' for cell in array):
-            break
+    run_session(_array_step, state, display_array, lambda state: state['pos'])
     
+    if state['result'] == 'cancel':
+        print()  # Move to next line before returning
+        return None
     return array
 
 def input_float_array(size: int,
@@ -183,6 +177,45 @@ def input_int_array(size: int,
     array = input_array(size, as_int=True, validator=validator)
     return [int(float(val)) for val in array] if array is not None else None
 
+def input_float_array_np(size: int,
+                      validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> Optional["numpy.ndarray"]:
+    """
+    Интерактивный ввод массива вещественных чисел в виде массива numpy.
+    
+    Args:
+        size (int): Размер массива
+        validator (callable, optional): Функция для проверки вводимых значений
+        
+    Returns:
+        Optional[numpy.ndarray]: Массив типа float64 или None если ввод был отменен
+    """
+    import numpy as np
+    
+    array = input_array(size, as_int=False, validator=validator)
+    if array is None:
+        return None
+    return np.fromiter(map(float, array), dtype=np.float64, count=size)
+
+def input_int_array_np(size: int,
+                    validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> Optional["numpy.ndarray"]:
+    """
+    Интерактивный ввод массива целых чисел в виде массива numpy.
+    Значения вне диапазона int64 отклоняются при вводе.
+    
+    Args:
+        size (int): Размер массива
+        validator (callable, optional): Функция для проверки вводимых значений
+        
+    Returns:
+        Optional[numpy.ndarray]: Массив типа int64 или None если ввод был отменен
+    """
+    import numpy as np
+    
+    array = input_array(size, as_int=True, validator=int64_validator(validator))
+    if array is None:
+        return None
+    return np.fromiter((int(float(val)) for val in array), dtype=np.int64, count=size)
+
 # Example usage
 if __name__ == "__main__":
     def custom_validator(value: str) -> Tuple[bool, str]:
@@ -1,37 +1,181 @@
-from tabulate import tabulate
-import os
-import sys
-import tty
-import termios
-from typing import Union, Callable, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from typing import Callable, Optional, Tuple, List
 
-def getch():
-    """Get a single character from stdin."""
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+from ._term import (
+    KEY_ESC, KEY_LEFT, KEY_RIGHT, KEY_UP, KEY_DOWN, NUMERIC_CHARS,
+    redraw, run_session, fmt_float, fmt_int, fmt_symbol, int64_validator,
+)
+
+# Formatter for the (as_int, as_symbol) flags of an input session, picked once
+# instead of checking the flags on every value
+_FORMATTERS = {
+    (False, False): fmt_float,
+    (True, False): fmt_int,
+    (False, True): fmt_symbol,
+    (True, True): fmt_symbol,
+}
 
 def format_number(value: str, as_int: bool = False, as_symbol: bool = False) -> str:
     """Format number string by removing leading zeros and proper decimal handling."""
-    if as_symbol:
-        return value
-    try:
-        if as_int:
-            return str(int(float(value)))
+    formatted = _FORMATTERS[(bool(as_int), bool(as_symbol))](value)
+    return value if formatted is None else formatted
+
+def _render_box(headers: List[str], table: List[List[str]],
+                col_widths: Optional[List[int]] = None) -> List[str]:
+    """
+    Render a table as a rounded grid of box-drawing characters, values right-aligned.
+    
+    Column widths default to the longest value, and at least two more than the header.
+    """
+    if col_widths is None:
+        col_widths = [max([len(header) + 2] + [len(str(row[k])) for row in table])
+                      for k, header in enumerate(headers)]
+    
+    def border(left: str, middle: str, right: str) -> str:
+        return left + middle.join('─' * (width + 2) for width in col_widths) + right
+    
+    def table_row(cells: list) -> str:
+        return '│' + '│'.join(f" {str(cell).rjust(width)} " for cell, width in zip(cells, col_widths)) + '│'
+    
+    separator = border('├', '┼', '┤')
+    lines = [border('╭', '┬', '╮'), table_row(headers), separator]
+    for i, row in enumerate(table):
+        lines.append(table_row(row))
+        lines.append(separator if i < len(table) - 1 else border('╰', '┴', '╯'))
+    return lines
+
+def _fill_cell(state: dict, row: int, col: int, value: str):
+    """Store a value and keep the list of empty cells up to date."""
+    matrix, empty = state['matrix'], state['empty']
+    if matrix[row][col] == '':
+        del empty[bisect_left(empty, row * state['cols'] + col)]
+    matrix[row][col] = value
+
+def _find_next_empty(state: dict, row: int, col: int):
+    """Find the next empty cell after the current position."""
+    empty = state['empty']
+    k = bisect_right(empty, row * state['cols'] + col)
+    if k < len(empty):
+        return divmod(empty[k], state['cols'])
+    return None
+
+def _find_prev_empty(state: dict, row: int, col: int):
+    """Find the first empty cell from the start up to current position."""
+    empty = state['empty']
+    if empty and empty[0] < row * state['cols'] + col:
+        return divmod(empty[0], state['cols'])
+    return None
+
+def _symbol_validator(value: str) -> Tuple[bool, str]:
+    """Default validator for symbols, which are entered one per cell."""
+    if len(value) == 1:
+        return True, ""
+    return False, "Введите один символ"
+
+def _matrix_state(rows: int, cols: int, as_int: bool = False, as_symbol: bool = False,
+                  validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> dict:
+    """
+    Everything the key handling works with, see _matrix_step.
+    
+    Numbers need no validator by default, any value the formatter accepts is valid.
+    """
+    if validator is None and as_symbol:
+        validator = _symbol_validator
+    return {
+        'rows': rows,
+        'cols': cols,
+        'format': _FORMATTERS[(bool(as_int), bool(as_symbol))],
+        'validator': validator,
+        'is_input_char': str.isprintable if as_symbol else NUMERIC_CHARS.__contains__,
+        'matrix': [['' for _ in range(cols)] for _ in range(rows)],
+        'row': 0,
+        'col': 0,
+        # Characters typed into the current cell, kept as a list so typing and Backspace edit it in place
+        'value': [],
+        'error': '',
+        # Sorted indices (row * cols + col) of the cells that are still empty
+        'empty': list(range(rows * cols)),
+        'result': None,
+    }
+
+def _matrix_step(state: dict, char: str) -> bool:
+    """
+    Apply one key to the matrix input state.
+    
+    Does no I/O: returns True if the key changed what should be displayed and sets
+    state['result'] to 'cancel' or 'complete' once the input is over.
+    """
+    rows, cols = state['rows'], state['cols']
+    
+    # Handle special keys
+    if char.startswith('\x1b['):  # Arrow keys
+        row, col = state['row'], state['col']
+        if char == KEY_UP and row > 0:
+            row -= 1
+        elif char == KEY_DOWN and row < rows - 1:
+            row += 1
+        elif char == KEY_LEFT and col > 0:
+            col -= 1
+        elif char == KEY_RIGHT and col < cols - 1:
+            col += 1
         else:
-            num = float(value)
-            # Remove trailing zeros after decimal point
-            s = f"{num}"
-            if '.' in s:
-                s = s.rstrip('0').rstrip('.')
-            return s
-    except ValueError:
-        return value
+            return False
+        state['value'].clear()
+        state.update(row=row, col=col, error='')
+        return True
+    elif char == KEY_ESC:  # Esc
+        state['result'] = 'cancel'
+        return False
+    elif char == '\r' or char == '\n':  # Enter
+        value = ''.join(state['value'])
+        if not value:
+            return False
+        # Only try to format and validate if there's any input.
+        # First check if the input format is valid, the formatted
+        # value is stored below
+        formatted_value = state['format'](value)
+        if formatted_value is None:
+            state['error'] = "Введите корректное число"
+            return True
+        
+        # Then run it through the validator, if there is one
+        if state['validator'] is not None:
+            is_valid, error = state['validator'](value)
+            if not is_valid:
+                state['error'] = error
+                return True
+        
+        _fill_cell(state, state['row'], state['col'], formatted_value)
+        state['value'].clear()
+        state['error'] = ''
+        
+        if not state['empty']:
+            # No empty cells left
+            state['result'] = 'complete'
+            return True
+        
+        # First try to find next empty cell
+        next_empty = _find_next_empty(state, state['row'], state['col'])
+        if next_empty is None:
+            # If no next empty, go to the first empty one before it
+            next_empty = _find_prev_empty(state, state['row'], state['col'])
+        state['row'], state['col'] = next_empty
+        return True
+    elif char == '\x7f':  # Backspace
+        if not state['value']:
+            return False
+        del state['value'][-1:]
+        state['error'] = ''
+        return True
+    
+    # Handle regular input - allow number characters (any printable ones for
+    # symbols) but validate on Enter
+    if not state['is_input_char'](char):
+        return False
+    state['value'].append(char)
+    state['error'] = ''
+    return True
 
 def input_matrix(rows: int, cols: int, as_int: bool = False, as_symbol: bool = False,
                 validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> list[list]:
@@ -51,181 +195,78 @@ def input_matrix(rows: int, cols: int, as_int: bool = False, as_symbol: bool = F
     Returns:
         list[list]: Введенная матрица
     """
-    def default_validator(value: str) -> Tuple[bool, str]:
-        if as_symbol:
-            if len(value) == 1:
-                return True, ""
-            return False, "Введите один символ"
-        try:
-            if as_int:
-                int(float(value))  # Check if can be converted to int
-            else:
-                float(value)
-            return True, ""
-        except ValueError:
-            return False, "Введите корректное число"
-    
-    if validator is None:
-        validator = default_validator
-    
-    matrix = [['' for _ in range(cols)] for _ in range(rows)]
-    current_row, current_col = 0, 0
-    current_value = ''
-    error_message = ''
-    last_display_lines = 0
-    first_display = True
-    
-    def move_cursor_up(n):
-        if n > 0:
-            print(f"\033[{n}A", end='')
-    
-    def clear_line():
-        print("\033[2K", end='')
+    state = _matrix_state(rows, cols, as_int, as_symbol, validator)
+    matrix = state['matrix']
+    last_display = []
     
-    def is_matrix_complete():
-        return all(all(cell != '' for cell in row) for row in matrix)
+    # Cached table: rendered lines, (line, offset, width) of each cell, column widths.
+    # Columns leave room for at least two more characters than their header
+    headers = [f"Ст. {i+1}" for i in range(cols)]
+    row_labels = [f"Стр. {i+1}" for i in range(rows)]
+    label_width = max(len(label) for label in row_labels)
+    frame_lines = []
+    cell_positions = {}
+    col_widths = [len(header) + 2 for header in headers]
     
-    def find_next_empty(row: int, col: int):
-        """Find the next empty cell after the current position."""
-        # Continue from current position
-        next_col = col + 1
-        for i in range(row, rows):
-            # If we're continuing from middle of row
-            start_col = next_col if i == row else 0
-            for j in range(start_col, cols):
-                if matrix[i][j] == '':
-                    return i, j
-        return None
+    def cell_text(i: int, j: int) -> str:
+        """Text shown in a cell, including the input cursor while input goes on."""
+        if i == state['row'] and j == state['col'] and state['result'] is None:
+            return ''.join(state['value']) + '█'
+        return matrix[i][j]
 
-    def find_prev_empty(row: int, col: int):
-        """Find the first empty cell from the start up to current position."""
-        # Check all cells from start up to current position
-        for i in range(row + 1):
-            for j in range(cols):
-                # Skip if we're at or after current position in the last row
-                if i == row and j >= col:
-                    break
-                if matrix[i][j] == '':
-                    return i, j
-        return None
+    def put_cell(i: int, j: int):
+        """Write a cell's text into the cached table lines."""
+        line_index, offset, width = cell_positions[(i, j)]
+        line = frame_lines[line_index]
+        frame_lines[line_index] = line[:offset] + cell_text(i, j).rjust(width) + line[offset + width:]
 
-    def display_matrix():
-        nonlocal last_display_lines, first_display
+    def build_frame():
+        """Lay out the table for the current column widths and fill in every cell."""
+        nonlocal frame_lines
+        table = [[label] + [''] * cols for label in row_labels]
+        frame_lines = _render_box([''] + headers, table, [label_width] + col_widths)
         
-        # Generate table content
-        headers = [f"Ст. {i+1}" for i in range(cols)]
-        table = []
         for i in range(rows):
-            row = [f"Стр. {i+1}"]
+            # Border, header, separator, then every row is followed by a separator
+            line_index = 3 + 2 * i
+            offset = label_width + 5
             for j in range(cols):
-                if i == current_row and j == current_col:
-                    value = current_value + '█' if current_value else '█'
-                    row.append(value)
-                else:
-                    value = matrix[i][j]
-                    row.append(value)
-            table.append(row)
-        
-        # Generate all display content first
-        table_str = tabulate(table, headers=[''] + headers, tablefmt='rounded_grid', stralign='right')
-        display_lines = table_str.split('\n')
-        display_lines.append("ESC - отмена, Enter - ввод, ← → ↑ ↓ - перемещение")
+                cell_positions[(i, j)] = (line_index, offset, col_widths[j])
+                put_cell(i, j)
+                offset += col_widths[j] + 3
+
+    def display_matrix(touched=()):
+        nonlocal last_display
         
-        if error_message:
-            display_lines.append(f"Ошибка: {error_message}")
+        # Cell values only change under the cursor, so besides the cursor cell only
+        # the cells it has been on since the last refresh need to be updated.
+        # The table is laid out again when one of them outgrows its column
+        cells = set(touched)
+        cells.add((state['row'], state['col']))
+        grown = False
+        for i, j in cells:
+            if len(cell_text(i, j)) > col_widths[j]:
+                col_widths[j] = len(cell_text(i, j))
+                grown = True
+        if grown or not frame_lines:
+            build_frame()
+        else:
+            for i, j in cells:
+                put_cell(i, j)
         
-        if not first_display:
-            # Clear previous display
-            move_cursor_up(last_display_lines)
-            for _ in range(last_display_lines):
-                clear_line()
-                print()
-            move_cursor_up(last_display_lines)
+        display_lines = frame_lines + ["ESC - отмена, Enter - ввод, ← → ↑ ↓ - перемещение"]
         
-        # Print new display
-        print('\n'.join(display_lines))
+        if state['error']:
+            display_lines.append(f"Ошибка: {state['error']}")
         
-        # Update line count for next refresh
-        last_display_lines = len(display_lines)
-        first_display = False
+        # Only rewrite what differs from the previous display
+        redraw(last_display, display_lines)
+        last_display = display_lines
     
-    while True:
-        display_matrix()
-        
-        char = getch()
-        
-        # Handle special keys
-        if ord(char) == 27:  # Esc
-            next_char = getch()
-            if next_char == '[':  # Arrow keys
-                direction = getch()
-                if direction == 'A' and current_row > 0:  # Up
-                    current_row -= 1
-                    current_value = ''
-                    error_message = ''
-                elif direction == 'B' and current_row < rows - 1:  # Down
-                    current_row += 1
-                    current_value = ''
-                    error_message = ''
-                elif direction == 'D' and current_col > 0:  # Left
-                    current_col -= 1
-                    current_value = ''
-                    error_message = ''
-                elif direction == 'C' and current_col < cols - 1:  # Right
-                    current_col += 1
-                    current_value = ''
-                    error_message = ''
-                continue
-            print()  # Move to next line before returning
-            return None
-        elif ord(char) == 13:  # Enter
-            if current_value:
-                # Only try to format and validate if there's any input
-                try:
-                    # First check if the input format is valid
-                    if as_int:
-                        test_value = int(float(current_value))
-                    elif as_symbol:
-                        test_value = current_value
-                    else:
-                        test_value = float(current_value)
-                    
-                    # Then run it through the validator
-                    is_valid, error = validator(current_value)
-                    if is_valid:
-                        formatted_value = format_number(current_value, as_int, as_symbol)
-                        matrix[current_row][current_col] = formatted_value
-                        current_value = ''
-                        error_message = ''
-                        
-                        # First try to find next empty cell
-                        next_empty = find_next_empty(current_row, current_col)
-                        if next_empty is not None:
-                            current_row, current_col = next_empty
-                        else:
-                            # If no next empty, try to find previous empty
-                            prev_empty = find_prev_empty(current_row, current_col)
-                            if prev_empty is not None:
-                                current_row, current_col = prev_empty
-                            else:
-                                # No empty cells left, return matrix
-                                print()  # Move to next line before returning
-                                return matrix
-                    else:
-                        error_message = error
-                except ValueError:
-                    error_message = "Введите корректное число"
-            continue
-        elif ord(char) == 127:  # Backspace
-            if current_value:
-                current_value = current_value[:-1]
-                error_message = ''
-            continue
-        
-        # Handle regular input - allow all printable characters but validate on Enter
-        if char.isprintable():
-            current_value += char
-            error_message = ''
+    run_session(_matrix_step, state, display_matrix, lambda state: (state['row'], state['col']))
+    
+    print()  # Move to next line before returning
+    return matrix if state['result'] == 'complete' else None
 
 def input_float_matrix(rows: int, cols: int,
                     validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> list[list[float]]:
@@ -259,6 +300,49 @@ def input_int_matrix(rows: int, cols: int,
     matrix = input_matrix(rows, cols, as_int=True, validator=validator)
     return [[int(float(val)) for val in row] for row in matrix]
 
+def input_float_matrix_np(rows: int, cols: int,
+                       validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> Optional["numpy.ndarray"]:
+    """
+    Интерактивный ввод матрицы вещественных чисел в виде массива numpy.
+    
+    Args:
+        rows (int): Количество строк матрицы
+        cols (int): Количество столбцов матрицы
+        validator (callable, optional): Функция для проверки вводимых значений
+        
+    Returns:
+        Optional[numpy.ndarray]: Матрица типа float64 размера rows x cols или None если ввод был отменен
+    """
+    import numpy as np
+    
+    matrix = input_matrix(rows, cols, as_int=False, validator=validator)
+    if matrix is None:
+        return None
+    values = map(float, chain.from_iterable(matrix))
+    return np.fromiter(values, dtype=np.float64, count=rows * cols).reshape(rows, cols)
+
+def input_int_matrix_np(rows: int, cols: int,
+                     validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> Optional["numpy.ndarray"]:
+    """
+    Интерактивный ввод матрицы целых чисел в виде массива numpy.
+    Значения вне диапазона int64 отклоняются при вводе.
+    
+    Args:
+        rows (int): Количество строк матрицы
+        cols (int): Количество столбцов матрицы
+        validator (callable, optional): Функция для проверки вводимых значений
+        
+    Returns:
+        Optional[numpy.ndarray]: Матрица типа int64 размера rows x cols или None если ввод был отменен
+    """
+    import numpy as np
+    
+    matrix = input_matrix(rows, cols, as_int=True, validator=int64_validator(validator))
+    if matrix is None:
+        return None
+    values = (int(float(val)) for val in chain.from_iterable(matrix))
+    return np.fromiter(values, dtype=np.int64, count=rows * cols).reshape(rows, cols)
+
 def input_symbol_matrix(rows: int, cols: int,
                     validator: Optional[Callable[[str], Tuple[bool, str]]] = None) -> list[list[str]]:
     """
@@ -295,4 +379,4 @@ if __name__ == "__main__":
         print("\nИтоговая матрица:")
         headers = [f"Ст. {i+1}" for i in range(3)]
         table = [[f"Стр. {i+1}"] + row for i, row in enumerate(result)]
-        print(tabulate(table, headers=[''] + headers, tablefmt='rounded_grid'))
\ No newline at end of file
+        print('\n'.join(_render_box([''] + headers, table)))
\ No newline at end of file